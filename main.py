@@ -1,11 +1,31 @@
 """
 main.py
 Point d'entrée du programme pour la gestion des mantes avec Raspberry Pi.
+
+Profil de performance : la boucle principale ne fait aucun calcul intensif.
+Elle est bornée par la latence des E/S (lectures GPIO, délais de conversion
+des capteurs, relais). Vectorisation, GPU ou quantification n'ont donc rien
+à gagner ici. Les leviers utiles sont :
+
+- le recouvrement des E/S (contrôleurs concurrents, lecture groupée du port) ;
+- le remplacement de l'attente active par des réveils sur événement ;
+- la disposition des données (Controllers, PortSnapshot) ;
+- la compilation (mypyc) des seuls outils dominés par des parcours de
+  dictionnaires, comme tests/diagnostics/analyse_cablage.py.
+
+Pour vérifier que ce profil reste exact, ALIMANTE_PROFILE=1 relance le
+programme sous py-spy et produit le flamegraph startup.svg.
 """
 
+import os
+import shutil
+import subprocess
 import sys
+import time
 import asyncio
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Any, Callable, Iterator, NamedTuple, Optional, Tuple
 
 # Imports corrects depuis les packages src
 from src.utils.config_manager import SystemConfig
@@ -29,21 +49,159 @@ from src.utils.select_config import select_config
 
 logger = get_logger("main")
 
-def initialize_system(config: SystemConfig) -> Dict[str, Any]:
+# Configurations fusionnées des contrôleurs et index des pins, conservés
+# d'une initialisation à l'autre ; vidé sur GPIO_INIT_FAILED ou si la
+# configuration change
+_SYSTEM_CACHE: Dict[str, Any] = {}
+
+def _air_quality_config(gpio_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Configuration du capteur de qualité de l'air dérivée de la config GPIO"""
+    return {
+        "pin": gpio_config.get("gpio_pins", {}).get("sensors", {}).get("mq2_gas", {}).get("gpio_pin", 22),
+        "voltage": "5.1V",
+        "current": 150
+    }
+
+def _fan_config(gpio_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Configuration des ventilateurs dérivée de la config GPIO"""
+    fan_hardware = gpio_config.get("hardware_config", {}).get("fan", {})
+    return {
+        "count": fan_hardware.get("count", 4),
+        "relay_pin": gpio_config.get("gpio_pins", {}).get("actuators", {}).get("fan_relay", {}).get("gpio_pin", 25),
+        "voltage": fan_hardware.get("voltage", "5.1V"),
+        "current_per_fan": fan_hardware.get("current_per_fan", "200mA"),
+        "total_current": fan_hardware.get("total_current", "800mA")
+    }
+
+# Contrôleurs dont la configuration ne vient pas d'une section de SystemConfig
+_DERIVED_CONFIGS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    'air_quality': _air_quality_config,
+    'fan': _fan_config,
+}
+
+# Contrôleurs initialisés au démarrage :
+# (nom, classe, section de config, libellé, période (s), poids)
+# La période reflète la constante de temps du phénomène piloté, le poids la
+# priorité du contrôleur : le réveil de base a lieu toutes les période/poids.
+_REGISTRY = (
+    ('temperature', TemperatureController, 'temperature', "température", 30, 3),
+    ('humidity', HumidityController, 'humidity', "humidité", 30, 3),
+    ('light', LightController, 'location', "éclairage", 60, 1),
+    ('feeding', FeedingController, 'feeding', "alimentation", 3600, 1),
+    ('air_quality', AirQualityController, 'air_quality', "qualité de l'air", 30, 1),
+    ('fan', FanController, 'fan', "ventilateurs", 30, 1),
+)
+
+# Intervalle de réveil de base de chaque contrôleur (secondes)
+_BASE_INTERVALS: Dict[str, float] = {
+    name: period / weight for name, _, _, _, period, weight in _REGISTRY
+}
+
+class Controllers(NamedTuple):
+    """Contrôleurs du système, None pour un contrôleur absent
+    
+    Les champs suivent l'ordre de _REGISTRY.
+    """
+    temperature: Optional[TemperatureController] = None
+    humidity: Optional[HumidityController] = None
+    light: Optional[LightController] = None
+    feeding: Optional[FeedingController] = None
+    air_quality: Optional[AirQualityController] = None
+    fan: Optional[FanController] = None
+    
+    def active(self) -> Iterator[Tuple[str, Any]]:
+        """Itère sur les couples (nom, contrôleur) des contrôleurs présents"""
+        for name, controller in zip(self._fields, self):
+            if controller is not None:
+                yield name, controller
+
+def _build_pin_index(gpio_config: Dict[str, Any]) -> Dict[str, int]:
+    """Résout chaque nom de pin (assignations et composants) en numéro BCM"""
+    pin_index = dict(gpio_config.get('pin_assignments', {}))
+    gpio_pins = gpio_config.get('gpio_pins', {})
+    for section in ('sensors', 'actuators'):
+        for name, pin_config in gpio_pins.get(section, {}).items():
+            if isinstance(pin_config, dict) and pin_config.get('gpio_pin') is not None:
+                pin_index.setdefault(name, pin_config['gpio_pin'])
+    return pin_index
+
+def _merged_config(config: SystemConfig, gpio_manager: GPIOManager, section: str) -> Dict[str, Any]:
+    """Retourne la configuration d'un contrôleur complétée par la config GPIO
+    
+    La fusion est mise en cache tant que la configuration reste la même :
+    une réinitialisation après une erreur de contrôleur ne refait aucune
+    fusion, seul l'instantané GPIO du gestionnaire courant est rattaché.
+    """
+    if _SYSTEM_CACHE.get('config') is not config:
+        _SYSTEM_CACHE.clear()
+        _SYSTEM_CACHE['config'] = config
+        _SYSTEM_CACHE['pin_index'] = _build_pin_index(config.gpio_config or {})
+        _SYSTEM_CACHE['merged'] = {}
+    
+    merged = _SYSTEM_CACHE['merged']
+    if section not in merged:
+        gpio_config = config.gpio_config or {}
+        if section in _DERIVED_CONFIGS:
+            base = _DERIVED_CONFIGS[section](gpio_config)
+        else:
+            base = getattr(config, section)
+        merged[section] = {
+            **base,
+            'gpio_config': config.gpio_config,
+            'pin_index': _SYSTEM_CACHE['pin_index']
+        }
+    
+    section_config: Dict[str, Any] = merged[section]
+    section_config['port_snapshot'] = gpio_manager.port_snapshot
+    return section_config
+
+def _init_controller(name: str, label: str, factory: Callable[[], Any]) -> Any:
+    """Crée un contrôleur et vérifie son statut
+    
+    Returns:
+        L'instance du contrôleur
+    Raises:
+        ControllerException: CONTROLLER_INIT_FAILED si la création ou la vérification échoue
+    """
+    try:
+        controller = factory()
+        if not controller.check_status():
+            raise create_exception(
+                ErrorCode.CONTROLLER_INIT_FAILED,
+                f"Échec d'initialisation du contrôleur {label}",
+                {"controller": name}
+            )
+        logger.info(f"✅ Contrôleur {label} initialisé")
+        return controller
+    except AlimanteException:
+        logger.error(f"❌ Échec initialisation contrôleur {label}")
+        raise
+    except Exception as e:
+        logger.exception(f"❌ Erreur initialisation contrôleur {label}")
+        raise create_exception(
+            ErrorCode.CONTROLLER_INIT_FAILED,
+            f"Erreur contrôleur {label}: {str(e)}",
+            {"controller": name, "original_error": str(e)}
+        )
+
+def initialize_system(gpio_manager: GPIOManager, config: SystemConfig) -> Controllers:
     """Initialize all system components with GPIO
     
+    Args:
+        gpio_manager: GPIO manager owned (and cleaned up) by the caller
+        config: System configuration
     Returns:
-        dict: Dictionary of controller instances
+        Controllers: Controller instances
     Raises:
         SystemException: If initialization fails
     """
     try:
         logger.info("🔧 Initialisation du système Alimante")
         
-        # Initialisation GPIO
-        gpio_manager = GPIOManager()
-        
+        # Vérification du GPIO
         if not gpio_manager.initialized:
+            # Le câblage a pu changer : tout sera recalculé au prochain essai
+            _SYSTEM_CACHE.clear()
             raise create_exception(
                 ErrorCode.GPIO_INIT_FAILED,
                 "Impossible d'initialiser le GPIO",
@@ -53,8 +211,6 @@ def initialize_system(config: SystemConfig) -> Dict[str, Any]:
         logger.info("✅ GPIO initialisé avec succès")
         
         # Initialisation des contrôleurs
-        controllers = {}
-        
         # Préparer la configuration complète avec GPIO pour chaque contrôleur
         # Vérifier que les configurations existent
         if not config.temperature:
@@ -78,142 +234,20 @@ def initialize_system(config: SystemConfig) -> Dict[str, Any]:
                 {"config_keys": list(config.__dict__.keys())}
             )
         
-        temp_config = config.temperature.copy()
-        temp_config['gpio_config'] = config.gpio_config
-        
-        humidity_config = config.humidity.copy()
-        humidity_config['gpio_config'] = config.gpio_config
-        
-        light_config = config.location.copy()
-        light_config['gpio_config'] = config.gpio_config
-        
-        feeding_config = config.feeding.copy()
-        feeding_config['gpio_config'] = config.gpio_config
-        
-        # Configuration pour la qualité de l'air et les ventilateurs
-        air_quality_config = {
-            "pin": config.gpio_config.get("gpio_pins", {}).get("sensors", {}).get("mq2_gas", {}).get("gpio_pin", 22),
-            "voltage": "5.1V",
-            "current": 150
-        }
-        air_quality_config['gpio_config'] = config.gpio_config
-        
-        fan_config = {
-            "count": config.gpio_config.get("hardware_config", {}).get("fan", {}).get("count", 4),
-            "relay_pin": config.gpio_config.get("gpio_pins", {}).get("actuators", {}).get("fan_relay", {}).get("gpio_pin", 25),
-            "voltage": config.gpio_config.get("hardware_config", {}).get("fan", {}).get("voltage", "5.1V"),
-            "current_per_fan": config.gpio_config.get("hardware_config", {}).get("fan", {}).get("current_per_fan", "200mA"),
-            "total_current": config.gpio_config.get("hardware_config", {}).get("fan", {}).get("total_current", "800mA")
-        }
-        fan_config['gpio_config'] = config.gpio_config
-        
-        # Contrôleur de température
-        try:
-            controllers['temperature'] = TemperatureController(gpio_manager, temp_config)
-            if not controllers['temperature'].check_status():
-                raise create_exception(
-                    ErrorCode.CONTROLLER_INIT_FAILED,
-                    "Échec d'initialisation du contrôleur de température",
-                    {"controller": "temperature"}
-                )
-            logger.info("✅ Contrôleur de température initialisé")
-        except Exception as e:
-            logger.exception("❌ Erreur initialisation contrôleur température")
-            raise create_exception(
-                ErrorCode.CONTROLLER_INIT_FAILED,
-                f"Erreur contrôleur température: {str(e)}",
-                {"controller": "temperature", "original_error": str(e)}
-            )
-        
-        # Contrôleur d'humidité
-        try:
-            controllers['humidity'] = HumidityController(gpio_manager, humidity_config)
-            if not controllers['humidity'].check_status():
-                raise create_exception(
-                    ErrorCode.CONTROLLER_INIT_FAILED,
-                    "Échec d'initialisation du contrôleur d'humidité",
-                    {"controller": "humidity"}
-                )
-            logger.info("✅ Contrôleur d'humidité initialisé")
-        except Exception as e:
-            logger.exception("❌ Erreur initialisation contrôleur humidité")
-            raise create_exception(
-                ErrorCode.CONTROLLER_INIT_FAILED,
-                f"Erreur contrôleur humidité: {str(e)}",
-                {"controller": "humidity", "original_error": str(e)}
-            )
-        
-        # Contrôleur d'éclairage
-        try:
-            controllers['light'] = LightController(gpio_manager, light_config)
-            if not controllers['light'].check_status():
-                raise create_exception(
-                    ErrorCode.CONTROLLER_INIT_FAILED,
-                    "Échec d'initialisation du contrôleur d'éclairage",
-                    {"controller": "light"}
-                )
-            logger.info("✅ Contrôleur d'éclairage initialisé")
-        except Exception as e:
-            logger.exception("❌ Erreur initialisation contrôleur éclairage")
-            raise create_exception(
-                ErrorCode.CONTROLLER_INIT_FAILED,
-                f"Erreur contrôleur éclairage: {str(e)}",
-                {"controller": "light", "original_error": str(e)}
-            )
-        
-        # Contrôleur d'alimentation
-        try:
-            controllers['feeding'] = FeedingController(gpio_manager, feeding_config)
-            if not controllers['feeding'].check_status():
-                raise create_exception(
-                    ErrorCode.CONTROLLER_INIT_FAILED,
-                    "Échec d'initialisation du contrôleur d'alimentation",
-                    {"controller": "feeding"}
-                )
-            logger.info("✅ Contrôleur d'alimentation initialisé")
-        except Exception as e:
-            logger.exception("❌ Erreur initialisation contrôleur alimentation")
-            raise create_exception(
-                ErrorCode.CONTROLLER_INIT_FAILED,
-                f"Erreur contrôleur alimentation: {str(e)}",
-                {"controller": "feeding", "original_error": str(e)}
-            )
-        
-        # Contrôleur de qualité de l'air
-        try:
-            controllers['air_quality'] = AirQualityController(gpio_manager, air_quality_config)
-            if not controllers['air_quality'].check_status():
-                raise create_exception(
-                    ErrorCode.CONTROLLER_INIT_FAILED,
-                    "Échec d'initialisation du contrôleur de qualité de l'air",
-                    {"controller": "air_quality"}
-                )
-            logger.info("✅ Contrôleur de qualité de l'air initialisé")
-        except Exception as e:
-            logger.exception("❌ Erreur initialisation contrôleur qualité de l'air")
-            raise create_exception(
-                ErrorCode.CONTROLLER_INIT_FAILED,
-                f"Erreur contrôleur qualité de l'air: {str(e)}",
-                {"controller": "air_quality", "original_error": str(e)}
-            )
-        
-        # Contrôleur de ventilateurs
-        try:
-            controllers['fan'] = FanController(gpio_manager, fan_config)
-            if not controllers['fan'].check_status():
-                raise create_exception(
-                    ErrorCode.CONTROLLER_INIT_FAILED,
-                    "Échec d'initialisation du contrôleur de ventilateurs",
-                    {"controller": "fan"}
-                )
-            logger.info("✅ Contrôleur de ventilateurs initialisé")
-        except Exception as e:
-            logger.exception("❌ Erreur initialisation contrôleur ventilateurs")
-            raise create_exception(
-                ErrorCode.CONTROLLER_INIT_FAILED,
-                f"Erreur contrôleur ventilateurs: {str(e)}",
-                {"controller": "fan", "original_error": str(e)}
-            )
+        # Les contrôleurs sondent leurs capteurs à la construction : ces
+        # attentes d'E/S indépendantes sont menées en parallèle.
+        # Les configurations sont fusionnées ici, _SYSTEM_CACHE n'étant pas
+        # partagé entre threads.
+        factories = [
+            (name, label, partial(controller_class, gpio_manager, _merged_config(config, gpio_manager, section)))
+            for name, controller_class, section, label, _, _ in _REGISTRY
+        ]
+        with ThreadPoolExecutor(max_workers=len(factories), thread_name_prefix="controller-init") as pool:
+            futures = {
+                name: pool.submit(_init_controller, name, label, factory)
+                for name, label, factory in factories
+            }
+            controllers = Controllers(**{name: future.result() for name, future in futures.items()})
         
         logger.info("🎉 Tous les contrôleurs initialisés avec succès")
         return controllers
@@ -229,103 +263,256 @@ def initialize_system(config: SystemConfig) -> Dict[str, Any]:
             {"original_error": str(e)}
         )
 
-async def run_system_loop(controllers: Dict[str, Any]):
-    """Boucle principale du système avec gestion d'erreurs robuste"""
+# Intervalle de réveil périodique par défaut (secondes). Celui de chaque
+# contrôleur part de son intervalle de base et s'adapte à l'activité :
+# allongé jusqu'à MAX_INTERVAL_FACTOR fois la base tant que rien ne change,
+# ramené vers la base après une action. MIN_CONTROL_INTERVAL borne les
+# réveils avancés par une échéance.
+CONTROL_INTERVAL = 30
+MIN_CONTROL_INTERVAL = 2
+MAX_INTERVAL_FACTOR = 4
+
+# Entrées dont un front réveille immédiatement le contrôleur associé :
+# nom du contrôleur -> (nom du pin, pin par défaut du contrôleur).
+# Le DHT22 n'y figure pas : sa ligne de données bascule à chaque lecture.
+EDGE_TRIGGERED_PINS = {
+    'light': ('LIGHT_SENSOR_PIN', 17),
+}
+
+# Délai minimal entre deux réveils sur front (secondes). La photorésistance
+# délivre un niveau analogique lent : au crépuscule et à l'aube il oscille
+# autour du seuil et produirait une rafale de fronts.
+EDGE_MIN_INTERVAL = 30
+
+def _ventilation_control(controllers: Controllers, fan: FanController) -> Callable[[], Optional[bool]]:
+    """Construit la fonction de contrôle de la ventilation
+    
+    fan est le contrôleur des ventilateurs de controllers, passé à part une
+    fois vérifié présent. Les contrôleurs sont résolus une fois pour toutes.
+    Les control_ventilation() renvoient True dès que la lecture a réussi :
+    la fonction retournée ne renvoie True que si l'état des ventilateurs a
+    changé, False en cas d'échec et None si rien n'a changé ou si aucune
+    mesure n'est disponible.
+    """
+    temperature = controllers.temperature
+    humidity = controllers.humidity
+    
+    def fan_state() -> Tuple[bool, int]:
+        return fan.fans_active, fan.current_speed
+    
+    def control_fans() -> Optional[bool]:
+        # Contrôle autonome des ventilateurs (température et humidité)
+        temp_value = None
+        humidity_value = None
+        
+        if temperature is not None:
+            temp_value = temperature.get_status().get('current_temperature', None)
+        
+        if humidity is not None:
+            humidity_value = humidity.get_status().get('current_humidity', None)
+        
+        if temp_value is None and humidity_value is None:
+            return None
+        
+        before = fan_state()
+        if not fan.control_ventilation(
+            temperature=temp_value or 25.0,
+            humidity=humidity_value or 60.0
+        ):
+            return False
+        if fan_state() == before:
+            return None
+        
+        fan_status = fan.get_status()
+        logger.debug(f"Ventilateurs: {fan_status.get('fans_active', False)} - Vitesse: {fan_status.get('current_speed', 0)}%")
+        return True
+    
+    if controllers.air_quality is None:
+        return control_fans
+    air_quality: AirQualityController = controllers.air_quality
+    
+    def control_air_quality() -> Optional[bool]:
+        # Lire la qualité de l'air et ajuster automatiquement les ventilateurs
+        before = fan_state()
+        if not air_quality.control_ventilation(fan):
+            return False
+        if fan_state() == before:
+            return None
+        
+        # Obtenir le statut pour le logging
+        air_status = air_quality.get_status()
+        fan_status = fan.get_status()
+        logger.debug(f"Qualité air: {air_status.get('current_quality', 'unknown')} - Ventilateurs: {fan_status.get('current_speed', 0)}%")
+        return True
+    
+    return control_air_quality
+
+def _next_interval(interval: float, success: Optional[bool], base_interval: float = CONTROL_INTERVAL) -> float:
+    """Calcule l'intervalle suivant selon le résultat du dernier contrôle
+    
+    control() renvoie True lorsqu'il a agi (relais basculé, repas servi) :
+    l'environnement évolue, on resserre la surveillance. Sinon on l'espace.
+    Le resserrement s'arrête à l'intervalle de base : un actionneur à
+    impulsion (brumisateur) renvoie True à chaque passage tant que la
+    consigne n'est pas atteinte, et ne doit pas être relancé plus souvent.
+    """
+    if success:
+        return max(interval * 0.5, base_interval)
+    return min(interval * 1.5, base_interval * MAX_INTERVAL_FACTOR)
+
+def _wake_delay(interval: float, deadline: Optional[float]) -> float:
+    """Calcule le délai avant le prochain réveil d'un contrôleur
+    
+    Une échéance future raccourcit l'attente. Une échéance déjà atteinte
+    (0) signifie que le contrôle qui vient de s'exécuter n'a pas agi :
+    elle est ignorée pour que les nouvelles tentatives suivent l'intervalle
+    adaptatif au lieu de s'enchaîner toutes les MIN_CONTROL_INTERVAL.
+    """
+    if deadline is None or deadline <= 0:
+        return interval
+    return max(MIN_CONTROL_INTERVAL, min(interval, deadline))
+
+async def _controller_task(
+    name: str,
+    action: str,
+    control: Callable[[], Optional[bool]],
+    event: asyncio.Event,
+    refresh_port: Callable[[], Any],
+    next_deadline: Optional[Callable[[], Optional[float]]] = None,
+    base_interval: float = CONTROL_INTERVAL
+) -> None:
+    """Exécute control() à chaque déclenchement de l'événement du contrôleur
+    
+    L'événement est levé par le réveil périodique ou par un front GPIO.
+    control() est bloquant (GPIO, capteurs) : il tourne dans l'exécuteur pour
+    que les attentes d'E/S des différents contrôleurs se recouvrent.
+    next_deadline, s'il est fourni, donne le délai avant la prochaine action
+    planifiée du contrôleur ; le réveil n'est pas programmé au-delà (voir _wake_delay).
+    base_interval est l'intervalle de départ, rétabli après une erreur.
+    """
+    loop = asyncio.get_running_loop()
+    timer: Optional[asyncio.TimerHandle] = None
+    interval = float(base_interval)
+    
+    # Méthodes résolues une seule fois, hors de la boucle
+    wait = event.wait
+    clear = event.clear
+    wake = event.set
+    run_in_executor = loop.run_in_executor
+    call_later = loop.call_later
+    
+    while True:
+        await wait()
+        clear()
+        if timer is not None:
+            timer.cancel()
+        logger.debug(f"🔄 Réveil contrôleur {name}")
+        
+        try:
+            # Une seule lecture du port pour toutes les entrées du contrôleur
+            refresh_port()
+            success = await run_in_executor(None, control)
+            if success is not None:
+                log_controller_action(name, action, success)
+            interval = _next_interval(interval, success, base_interval)
+        except Exception as e:
+            logger.error(f"❌ Erreur contrôle {name}: {e}")
+            log_controller_action(name, action, False, context_factory=lambda: {"error": str(e)})
+            interval = float(base_interval)
+        
+        deadline = next_deadline() if next_deadline is not None else None
+        timer = call_later(_wake_delay(interval, deadline), wake)
+
+def _edge_waker(
+    loop: asyncio.AbstractEventLoop,
+    event: asyncio.Event,
+    min_interval: float = EDGE_MIN_INTERVAL
+) -> Callable[[int], None]:
+    """Construit le callback de front qui lève l'événement d'un contrôleur
+    
+    Le callback s'exécute dans le thread RPi.GPIO. Les fronts survenant moins
+    de min_interval secondes après le dernier réveil accepté sont ignorés.
+    """
+    last_wake = float('-inf')
+    
+    def on_edge(_pin: int) -> None:
+        nonlocal last_wake
+        now = time.monotonic()
+        if now - last_wake < min_interval:
+            return
+        last_wake = now
+        loop.call_soon_threadsafe(event.set)
+    
+    return on_edge
+
+def _register_edge_triggers(controllers: Controllers, events: Dict[str, asyncio.Event]) -> None:
+    """Réveille les contrôleurs sur les fronts de leurs entrées GPIO"""
+    loop = asyncio.get_running_loop()
+    
+    for name, (pin_name, default_pin) in EDGE_TRIGGERED_PINS.items():
+        controller = getattr(controllers, name)
+        if controller is None:
+            continue
+        
+        # Même résolution que le contrôleur ; None si le pin est désactivé
+        pin = controller.get_pin(pin_name, default_pin)
+        if pin is None:
+            continue
+        
+        if controller.gpio_manager.add_edge_callback(pin, _edge_waker(loop, events[name])):
+            logger.info(f"⚡ Contrôleur {name} réveillé sur les fronts du pin {pin}")
+
+async def run_system_loop(controllers: Controllers, gpio_manager: GPIOManager) -> None:
+    """Boucle principale du système pilotée par événements
+    
+    Chaque contrôleur tourne dans sa propre tâche et n'est réveillé que par
+    son minuteur périodique ou par un front sur l'une de ses entrées.
+    """
     logger.info("🔄 Démarrage de la boucle principale du système")
     
-    cycle_count = 0
+    # (nom, action, méthode control liée), construit une fois avant la boucle
+    steps: Tuple[Tuple[str, str, Callable[[], Optional[bool]]], ...] = tuple(
+        (name, "control", controller.control)
+        for name, controller in (
+            ('temperature', controllers.temperature),
+            ('humidity', controllers.humidity),
+            ('light', controllers.light),
+            ('feeding', controllers.feeding),
+        )
+        if controller is not None
+    )
+    if controllers.fan is not None:
+        ventilation_name = 'air_quality' if controllers.air_quality is not None else 'fan'
+        steps += ((ventilation_name, "control_ventilation", _ventilation_control(controllers, controllers.fan)),)
+    
+    # Premier contrôle immédiat pour chaque contrôleur
+    events = {name: asyncio.Event() for name, _, _ in steps}
+    for event in events.values():
+        event.set()
+    
+    # Un thread par contrôleur : aucun contrôle n'attend la fin d'un autre
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, len(steps)),
+        thread_name_prefix="controller"
+    )
+    loop.set_default_executor(executor)
+    
+    # Le réveil de l'alimentation ne dépasse jamais le prochain repas prévu
+    deadlines: Dict[str, Callable[[], Optional[float]]] = {}
+    if controllers.feeding is not None:
+        deadlines['feeding'] = controllers.feeding.seconds_until_next_feeding
     
     try:
-        while True:
-            cycle_count += 1
-            logger.debug(f"🔄 Cycle système #{cycle_count}")
-            
-            # Contrôle de la température
-            if 'temperature' in controllers:
-                try:
-                    success = controllers['temperature'].control()
-                    log_controller_action("temperature", "control", success)
-                except Exception as e:
-                    logger.error(f"❌ Erreur contrôle température: {e}")
-                    log_controller_action("temperature", "control", False, {"error": str(e)})
-            
-            # Contrôle de l'humidité
-            if 'humidity' in controllers:
-                try:
-                    success = controllers['humidity'].control()
-                    log_controller_action("humidity", "control", success)
-                except Exception as e:
-                    logger.error(f"❌ Erreur contrôle humidité: {e}")
-                    log_controller_action("humidity", "control", False, {"error": str(e)})
-            
-            # Contrôle de l'éclairage
-            if 'light' in controllers:
-                try:
-                    success = controllers['light'].control()
-                    log_controller_action("light", "control", success)
-                except Exception as e:
-                    logger.error(f"❌ Erreur contrôle éclairage: {e}")
-                    log_controller_action("light", "control", False, {"error": str(e)})
-            
-            # Contrôle de l'alimentation
-            if 'feeding' in controllers:
-                try:
-                    success = controllers['feeding'].control()
-                    log_controller_action("feeding", "control", success)
-                except Exception as e:
-                    logger.error(f"❌ Erreur contrôle alimentation: {e}")
-                    log_controller_action("feeding", "control", False, {"error": str(e)})
-            
-            # Contrôle de la qualité de l'air et ventilation
-            if 'air_quality' in controllers and 'fan' in controllers:
-                try:
-                    # Lire la qualité de l'air et ajuster automatiquement les ventilateurs
-                    success = controllers['air_quality'].control_ventilation(controllers['fan'])
-                    log_controller_action("air_quality", "control_ventilation", success)
-                    
-                    if success:
-                        # Obtenir le statut pour le logging
-                        air_status = controllers['air_quality'].get_status()
-                        fan_status = controllers['fan'].get_status()
-                        logger.debug(f"Qualité air: {air_status.get('current_quality', 'unknown')} - Ventilateurs: {fan_status.get('current_speed', 0)}%")
-                    
-                except Exception as e:
-                    logger.error(f"❌ Erreur contrôle qualité air/ventilation: {e}")
-                    log_controller_action("air_quality", "control_ventilation", False, {"error": str(e)})
-            
-            # Contrôle autonome des ventilateurs (température et humidité)
-            elif 'fan' in controllers:
-                try:
-                    # Obtenir les valeurs actuelles depuis les autres contrôleurs
-                    temp_value = None
-                    humidity_value = None
-                    
-                    if 'temperature' in controllers:
-                        temp_status = controllers['temperature'].get_status()
-                        temp_value = temp_status.get('current_temperature', None)
-                    
-                    if 'humidity' in controllers:
-                        humidity_status = controllers['humidity'].get_status()
-                        humidity_value = humidity_status.get('current_humidity', None)
-                    
-                    # Contrôle automatique des ventilateurs basé sur température/humidité
-                    if temp_value is not None or humidity_value is not None:
-                        success = controllers['fan'].control_ventilation(
-                            temperature=temp_value or 25.0,
-                            humidity=humidity_value or 60.0
-                        )
-                        log_controller_action("fan", "control_ventilation", success)
-                        
-                        if success:
-                            fan_status = controllers['fan'].get_status()
-                            logger.debug(f"Ventilateurs: {fan_status.get('fans_active', False)} - Vitesse: {fan_status.get('current_speed', 0)}%")
-                    
-                except Exception as e:
-                    logger.error(f"❌ Erreur contrôle ventilateurs: {e}")
-                    log_controller_action("fan", "control_ventilation", False, {"error": str(e)})
-            
-            # Pause entre les cycles
-            await asyncio.sleep(30)  # Contrôle toutes les 30 secondes
+        _register_edge_triggers(controllers, events)
+        await asyncio.gather(*(
+            _controller_task(
+                name, action, control, events[name],
+                gpio_manager.refresh_port_snapshot, deadlines.get(name),
+                _BASE_INTERVALS.get(name, CONTROL_INTERVAL)
+            )
+            for name, action, control in steps
+        ))
             
     except KeyboardInterrupt:
         logger.info("⏹️ Arrêt demandé par l'utilisateur")
@@ -334,30 +521,75 @@ async def run_system_loop(controllers: Dict[str, Any]):
         raise create_exception(
             ErrorCode.SYSTEM_INIT_FAILED,
             f"Erreur dans la boucle principale: {str(e)}",
-            {"cycle_count": cycle_count, "original_error": str(e)}
+            {"original_error": str(e)}
         )
     finally:
-        # Nettoyage
-        logger.info("🧹 Nettoyage des ressources")
+        # Annuler les tâches n'arrête pas les control() déjà lancés : on les
+        # laisse finir avant que les contrôleurs et le GPIO soient libérés
+        executor.shutdown(wait=True)
+
+def _cleanup_controllers(controllers: Controllers) -> None:
+    """Nettoie les contrôleurs qui exposent une méthode cleanup()"""
+    for controller_name, controller in controllers.active():
         try:
-            # Nettoyer les contrôleurs
-            for controller_name, controller in controllers.items():
-                try:
-                    if hasattr(controller, 'cleanup'):
-                        controller.cleanup()
-                        logger.debug(f"✅ Contrôleur {controller_name} nettoyé")
-                except Exception as e:
-                    logger.warning(f"⚠️ Erreur lors du nettoyage du contrôleur {controller_name}: {e}")
-            
-            # Nettoyer GPIO
-            if 'gpio_manager' in globals():
-                gpio_manager.cleanup()
-                logger.info("✅ GPIO nettoyé")
+            if hasattr(controller, 'cleanup'):
+                controller.cleanup()
+                logger.debug(f"✅ Contrôleur {controller_name} nettoyé")
         except Exception as e:
-            logger.error(f"❌ Erreur lors du nettoyage: {e}")
+            logger.warning(f"⚠️ Erreur lors du nettoyage du contrôleur {controller_name}: {e}")
+
+async def run_system(config: SystemConfig) -> None:
+    """Initialise le système puis exécute la boucle principale
+    
+    Le GPIO et les contrôleurs sont libérés à la sortie, y compris sur erreur.
+    """
+    async with GPIOManager() as gpio_manager:
+        controllers = initialize_system(gpio_manager, config)
+        controller_count = sum(1 for _ in controllers.active())
+        
+        if not controller_count:
+            raise create_exception(
+                ErrorCode.SYSTEM_INIT_FAILED,
+                "Aucun contrôleur initialisé"
+            )
+        
+        logger.info(f"✅ Système initialisé avec {controller_count} contrôleurs")
+        
+        try:
+            await run_system_loop(controllers, gpio_manager)
+        finally:
+            logger.info("🧹 Nettoyage des ressources")
+            _cleanup_controllers(controllers)
+
+# Variable d'environnement activant le profilage au démarrage
+PROFILE_ENV = 'ALIMANTE_PROFILE'
+
+def _run_profiled() -> Optional[int]:
+    """Relance le programme sous py-spy pour produire un flamegraph
+    
+    Returns:
+        Code de retour du programme profilé, None si py-spy est indisponible
+    """
+    py_spy = shutil.which('py-spy')
+    if py_spy is None:
+        logger.warning(f"⚠️ {PROFILE_ENV}=1 mais py-spy est introuvable, profilage ignoré")
+        return None
+    
+    # Le processus profilé ne doit pas se relancer lui-même
+    env = {key: value for key, value in os.environ.items() if key != PROFILE_ENV}
+    command = [py_spy, 'record', '--rate', '250', '-o', 'startup.svg', '--', sys.executable, *sys.argv]
+    logger.info(f"📈 Profilage avec py-spy: {' '.join(command)}")
+    return subprocess.call(command, env=env)
 
-def main():
+def main() -> None:
     """Point d'entrée principal avec gestion d'erreurs complète"""
+    # Profilage à la demande : le programme tourne alors dans py-spy, qui
+    # démarre et arrête lui-même le système
+    if os.environ.get(PROFILE_ENV) == '1':
+        exit_code = _run_profiled()
+        if exit_code is not None:
+            sys.exit(exit_code)
+    
     try:
         # Initialisation du logging
         logger = get_logger()
@@ -390,19 +622,8 @@ def main():
         
         logger.info("✅ Configuration chargée avec succès")
         
-        # Initialisation du système
-        controllers = initialize_system(config)
-        
-        if not controllers:
-            raise create_exception(
-                ErrorCode.SYSTEM_INIT_FAILED,
-                "Aucun contrôleur initialisé"
-            )
-            
-        logger.info(f"✅ Système initialisé avec {len(controllers)} contrôleurs")
-        
-        # Démarrage de la boucle principale
-        asyncio.run(run_system_loop(controllers))
+        # Initialisation du système et démarrage de la boucle principale
+        asyncio.run(run_system(config))
         
     except AlimanteException as e:
         logger.critical(f"💥 Erreur système: {e.message}", {
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Optional
 from ..utils.gpio_manager import GPIOManager
 from ..utils.logging_config import get_logger
 
@@ -9,6 +9,8 @@ class BaseController(ABC):
     def __init__(self, gpio_manager: GPIOManager, config: Dict[str, Any]):
         self.gpio_manager = gpio_manager
         self.config = config
+        # Instantané des niveaux GPIO partagé, rafraîchi par la boucle principale
+        self.port_snapshot = config.get('port_snapshot')
         self.logger = get_logger(self.__class__.__name__)
         self.initialized = False
         self.error_count = 0
@@ -29,6 +31,38 @@ class BaseController(ABC):
         """Méthode principale de contrôle"""
         pass
     
+    def get_pin(self, pin_name: str, default: int) -> int:
+        """Retourne le numéro BCM d'un pin nommé (index précalculé, sinon config GPIO)"""
+        pin_index = self.config.get('pin_index')
+        if pin_index and pin_name in pin_index:
+            indexed_pin: int = pin_index[pin_name]
+            return indexed_pin
+        pin_assignments = self.config.get('gpio_config', {}).get('pin_assignments', {})
+        pin: int = pin_assignments.get(pin_name, default)
+        return pin
+    
+    def pin_reader(self, pin: int) -> Callable[[], Optional[bool]]:
+        """Construit une fonction de lecture dédiée à un pin fixé à l'initialisation
+        
+        Le masque du pin et l'instantané sont capturés une fois pour toutes,
+        la lecture ne fait plus ni recherche d'attribut ni décalage. Un pin
+        non configuré passe par get_pin_state(), qui renvoie alors None.
+        """
+        get_pin_state = self.gpio_manager.get_pin_state
+        snapshot = self.port_snapshot
+        if snapshot is None or not 0 <= pin < 32:
+            return lambda: get_pin_state(pin)
+        
+        configured_pins = self.gpio_manager.pins
+        mask = 1 << pin
+        
+        def read() -> Optional[bool]:
+            if snapshot.valid and pin in configured_pins:
+                return bool(snapshot.value & mask)
+            return get_pin_state(pin)
+        
+        return read
+    
     def is_initialized(self) -> bool:
         """Vérifie si le contrôleur est initialisé"""
         return self.initialized
@@ -126,6 +126,21 @@ class FeedingController(BaseController):
             self.record_error(e)
             return False
 
+    def seconds_until_next_feeding(self) -> Optional[float]:
+        """
+        Calcule le délai avant le prochain repas prévu.
+        
+        :return: Délai en secondes (0 si le repas est dû), None si aucun repas n'est prévu
+        """
+        if self.last_feeding_time is None:
+            return 0.0
+        
+        if self.feeding_count >= self.feeding_config.feed_count:
+            return None
+        
+        next_feeding = self.last_feeding_time + timedelta(days=self.feeding_config.interval_days)
+        return max(0.0, (next_feeding - datetime.now()).total_seconds())
+
     def control_feeding(self) -> bool:
         """
         Contrôle l'alimentation automatique.
@@ -198,12 +213,11 @@ class FeedingController(BaseController):
         :return: True si l'ouverture a réussi, False sinon
         """
         try:
-            # Récupérer le pin depuis la config GPIO
-            gpio_config = self.config.get('gpio_config', {})
-            pin_assignments = gpio_config.get('pin_assignments', {})
-            feeding_servo_pin = pin_assignments.get('FEEDING_SERVO_PIN', 12)
+            # Pin résolu à l'initialisation du système
+            feeding_servo_pin = self.get_pin('FEEDING_SERVO_PIN', 12)
             
             # Récupérer la configuration matérielle
+            gpio_config = self.config.get('gpio_config', {})
             hardware_config = gpio_config.get('hardware_config', {})
             servo_config = hardware_config.get('servo', {}).get('feeding_trap', {})
             
@@ -232,12 +246,11 @@ class FeedingController(BaseController):
         :return: True si la fermeture a réussi, False sinon
         """
         try:
-            # Récupérer le pin depuis la config GPIO
-            gpio_config = self.config.get('gpio_config', {})
-            pin_assignments = gpio_config.get('pin_assignments', {})
-            feeding_servo_pin = pin_assignments.get('FEEDING_SERVO_PIN', 12)
+            # Pin résolu à l'initialisation du système
+            feeding_servo_pin = self.get_pin('FEEDING_SERVO_PIN', 12)
             
             # Récupérer la configuration matérielle
+            gpio_config = self.config.get('gpio_config', {})
             hardware_config = gpio_config.get('hardware_config', {})
             servo_config = hardware_config.get('servo', {}).get('feeding_trap', {})
             
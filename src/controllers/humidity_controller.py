@@ -46,6 +46,7 @@ class HumidityController(BaseController):
         
         # Configuration des pins
         self._setup_pins()
+        self._read_sprayer = self.pin_reader(self.get_pin('HUMIDITY_RELAY_PIN', 23))
         self.initialized = True
         
     def _setup_pins(self):
@@ -96,10 +97,8 @@ class HumidityController(BaseController):
             import adafruit_dht
             import board
             
-            # Récupérer le pin depuis la config GPIO
-            gpio_config = self.config.get('gpio_config', {})
-            pin_assignments = gpio_config.get('pin_assignments', {})
-            temp_humidity_pin = pin_assignments.get('TEMP_HUMIDITY_PIN', 4)
+            # Pin résolu à l'initialisation du système
+            temp_humidity_pin = self.get_pin('TEMP_HUMIDITY_PIN', 4)
             
             # Initialiser le capteur DHT22 sur le pin configuré
             dht = adafruit_dht.DHT22(getattr(board, f'D{temp_humidity_pin}'))
@@ -163,10 +162,8 @@ class HumidityController(BaseController):
         :return: True si l'activation a réussi, False sinon
         """
         try:
-            # Récupérer le pin depuis la config GPIO
-            gpio_config = self.config.get('gpio_config', {})
-            pin_assignments = gpio_config.get('pin_assignments', {})
-            humidity_pin = pin_assignments.get('HUMIDITY_RELAY_PIN', 23)
+            # Pin résolu à l'initialisation du système
+            humidity_pin = self.get_pin('HUMIDITY_RELAY_PIN', 23)
             
             self.gpio_manager.set_pin_state(humidity_pin, True)
             self.logger.info("Ultrasonic mist activé")
@@ -189,10 +186,8 @@ class HumidityController(BaseController):
         :return: True si la désactivation a réussi, False sinon
         """
         try:
-            # Récupérer le pin depuis la config GPIO
-            gpio_config = self.config.get('gpio_config', {})
-            pin_assignments = gpio_config.get('pin_assignments', {})
-            humidity_pin = pin_assignments.get('HUMIDITY_RELAY_PIN', 23)
+            # Pin résolu à l'initialisation du système
+            humidity_pin = self.get_pin('HUMIDITY_RELAY_PIN', 23)
             
             self.gpio_manager.set_pin_state(humidity_pin, False)
             self.logger.info("Ultrasonic mist désactivé")
@@ -210,12 +205,8 @@ class HumidityController(BaseController):
         :return: True si l'ultrasonic mist est actif, False sinon
         """
         try:
-            # Récupérer le pin depuis la config GPIO
-            gpio_config = self.config.get('gpio_config', {})
-            pin_assignments = gpio_config.get('pin_assignments', {})
-            humidity_pin = pin_assignments.get('HUMIDITY_RELAY_PIN', 23)
-            
-            return self.gpio_manager.get_pin_state(humidity_pin)
+            # Lecture spécialisée construite à l'initialisation
+            return self._read_sprayer()
             
         except Exception as e:
             self.logger.error(f"Erreur lors de la vérification de l'ultrasonic mist: {e}")
@@ -58,6 +58,7 @@ class LightController(BaseController):
         # Configuration des pins
         self.is_available = False  # Disponibilité du composant
         self._setup_pins()
+        self._read_light = self.pin_reader(self.get_pin('LIGHT_RELAY_PIN', 24))
         
         # Calcul des heures de lever/coucher
         if SUN_CALCULATION_AVAILABLE:
@@ -235,10 +236,8 @@ class LightController(BaseController):
         :return: True si l'activation a réussi, False sinon
         """
         try:
-            # Récupérer le pin depuis la config GPIO
-            gpio_config = self.config.get('gpio_config', {})
-            pin_assignments = gpio_config.get('pin_assignments', {})
-            light_pin = pin_assignments.get('LIGHT_RELAY_PIN', 24)
+            # Pin résolu à l'initialisation du système
+            light_pin = self.get_pin('LIGHT_RELAY_PIN', 24)
             
             self.gpio_manager.set_pin_state(light_pin, True)
             self.logger.info("Éclairage activé")
@@ -256,10 +255,8 @@ class LightController(BaseController):
         :return: True si la désactivation a réussi, False sinon
         """
         try:
-            # Récupérer le pin depuis la config GPIO
-            gpio_config = self.config.get('gpio_config', {})
-            pin_assignments = gpio_config.get('pin_assignments', {})
-            light_pin = pin_assignments.get('LIGHT_RELAY_PIN', 24)
+            # Pin résolu à l'initialisation du système
+            light_pin = self.get_pin('LIGHT_RELAY_PIN', 24)
             
             self.gpio_manager.set_pin_state(light_pin, False)
             self.logger.info("Éclairage désactivé")
@@ -277,12 +274,8 @@ class LightController(BaseController):
         :return: True si l'éclairage est allumé, False sinon
         """
         try:
-            # Récupérer le pin depuis la config GPIO
-            gpio_config = self.config.get('gpio_config', {})
-            pin_assignments = gpio_config.get('pin_assignments', {})
-            light_pin = pin_assignments.get('LIGHT_RELAY_PIN', 24)
-            
-            return self.gpio_manager.get_pin_state(light_pin)
+            # Lecture spécialisée construite à l'initialisation
+            return self._read_light()
             
         except Exception as e:
             self.logger.error(f"Erreur lors de la vérification de l'éclairage: {e}")
@@ -296,10 +289,8 @@ class LightController(BaseController):
         :return: Valeur de luminosité ou None si la lecture échoue
         """
         try:
-            # Récupérer le pin depuis la config GPIO
-            gpio_config = self.config.get('gpio_config', {})
-            pin_assignments = gpio_config.get('pin_assignments', {})
-            light_sensor_pin = pin_assignments.get('LIGHT_SENSOR_PIN', 17)
+            # Pin résolu à l'initialisation du système
+            light_sensor_pin = self.get_pin('LIGHT_SENSOR_PIN', 17)
             
             # Lecture analogique du capteur LDR
             # Note: Cette implémentation dépend du type de capteur utilisé
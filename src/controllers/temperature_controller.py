@@ -44,6 +44,7 @@ class TemperatureController(BaseController):
         
         # Configuration des pins depuis la config GPIO
         self._setup_pins()
+        self._read_heating = self.pin_reader(self.get_pin('HEATING_RELAY_PIN', 18))
         self.initialized = True
         
     def _setup_pins(self):
@@ -155,10 +156,8 @@ class TemperatureController(BaseController):
         :return: True si l'activation a réussi, False sinon.
         """
         try:
-            # Récupérer le pin depuis la config GPIO
-            gpio_config = self.config.get('gpio_config', {})
-            pin_assignments = gpio_config.get('pin_assignments', {})
-            heating_pin = pin_assignments.get('HEATING_RELAY_PIN', 18)
+            # Pin résolu à l'initialisation du système
+            heating_pin = self.get_pin('HEATING_RELAY_PIN', 18)
             
             self.gpio_manager.set_pin_state(heating_pin, True)
             self.logger.info("Chauffage activé")
@@ -176,10 +175,8 @@ class TemperatureController(BaseController):
         :return: True si la désactivation a réussi, False sinon.
         """
         try:
-            # Récupérer le pin depuis la config GPIO
-            gpio_config = self.config.get('gpio_config', {})
-            pin_assignments = gpio_config.get('pin_assignments', {})
-            heating_pin = pin_assignments.get('HEATING_RELAY_PIN', 18)
+            # Pin résolu à l'initialisation du système
+            heating_pin = self.get_pin('HEATING_RELAY_PIN', 18)
             
             self.gpio_manager.set_pin_state(heating_pin, False)
             self.logger.info("Chauffage désactivé")
@@ -197,12 +194,8 @@ class TemperatureController(BaseController):
         :return: True si le chauffage est actif, False sinon.
         """
         try:
-            # Récupérer le pin depuis la config GPIO
-            gpio_config = self.config.get('gpio_config', {})
-            pin_assignments = gpio_config.get('pin_assignments', {})
-            heating_pin = pin_assignments.get('HEATING_RELAY_PIN', 18)
-            
-            return self.gpio_manager.get_pin_state(heating_pin)
+            # Lecture spécialisée construite à l'initialisation
+            return self._read_heating()
             
         except Exception as e:
             self.logger.error(f"Erreur lors de la vérification du chauffage: {e}")
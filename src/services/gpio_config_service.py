@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 
+from ..utils.config_manager import load_json_file
 from ..utils.logging_config import get_logger
 from ..utils.exceptions import create_exception, ErrorCode, AlimanteException
 
@@ -73,8 +74,7 @@ class GPIOConfigService:
                     {"path": str(self.config_path)}
                 )
             
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.gpio_config = json.load(f)
+            self.gpio_config = load_json_file(self.config_path)
             
             # Extraire les différentes sections
             self._extract_sensors_config()
@@ -1,9 +1,36 @@
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, Callable, Optional, Union
 import json
 import os
 import logging
 
+# Parseur JSON natif si disponible (orjson est optionnel)
+_json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+@lru_cache(maxsize=8)
+def _load_json_cached(path: str, mtime_ns: int) -> Any:
+    return _json_loads(Path(path).read_bytes())
+
+def load_json_file(path: Union[str, Path]) -> Any:
+    """
+    Charge un fichier JSON, mis en cache tant qu'il n'est pas modifié.
+    
+    Le résultat est partagé entre les appelants : il ne doit pas être modifié.
+    
+    :param path: Chemin du fichier JSON
+    :return: Contenu du fichier
+    :raises FileNotFoundError: Si le fichier n'existe pas
+    :raises json.JSONDecodeError: Si le JSON est invalide
+    """
+    return _load_json_cached(str(path), os.stat(path).st_mtime_ns)
+
 @dataclass
 class SystemConfig:
     """Configuration système pour Alimante"""
@@ -43,18 +70,15 @@ class SystemConfig:
         
         try:
             # Charger la configuration commune
-            with open(common_config_path, 'r', encoding='utf-8') as f:
-                common_data = json.load(f)
+            common_data = load_json_file(common_config_path)
             
             # Charger la configuration spécifique à l'espèce
-            with open(specific_config_path, 'r', encoding='utf-8') as f:
-                specific_data = json.load(f)
+            specific_data = load_json_file(specific_config_path)
             
             # Charger la configuration GPIO si fournie
             gpio_data = {}
             if gpio_config_path and os.path.exists(gpio_config_path):
-                with open(gpio_config_path, 'r', encoding='utf-8') as f:
-                    gpio_data = json.load(f)
+                gpio_data = load_json_file(gpio_config_path)
             
             # Combiner les configurations
             # La configuration spécifique a la priorité sur la commune
@@ -256,4 +280,4 @@ class SystemConfig:
             
         except Exception as e:
             logging.error(f"Erreur lors de la validation de la configuration: {e}")
-            return False
\ No newline at end of file
+            return False
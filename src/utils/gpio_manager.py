@@ -5,8 +5,13 @@ Gestionnaire GPIO pour Raspberry Pi - remplace SerialManager
 
 import RPi.GPIO as GPIO
 import logging
+import mmap
+import os
+import struct
+import threading
 import time
-from typing import Optional, Dict, Any
+from types import TracebackType
+from typing import Optional, Dict, Any, Callable, Type
 from dataclasses import dataclass
 from enum import Enum
 
@@ -24,14 +29,60 @@ class PinConfig:
     component_name: Optional[str] = None  # Nom du composant pour le logging
     required: bool = True  # Si le composant est requis pour le fonctionnement
 
+# Registres GPIO BCM2835/BCM2711 exposés par /dev/gpiomem
+GPIOMEM_PATH = "/dev/gpiomem"
+GPIOMEM_SIZE = 4096
+GPLEV0_OFFSET = 0x34  # Niveaux des GPIO 0-31
+
+@dataclass
+class PortSnapshot:
+    """Niveaux des GPIO 0-31 lus en une seule lecture du registre GPLEV0"""
+    value: int = 0
+    valid: bool = False
+    
+    def update(self, port: Optional[int]) -> None:
+        """Met à jour l'instantané (None si la lecture groupée est indisponible)"""
+        if port is None:
+            self.valid = False
+        else:
+            self.value = port
+            self.valid = True
+    
+    def invalidate(self) -> None:
+        """Marque l'instantané comme périmé"""
+        self.valid = False
+
 class GPIOManager:
-    """Gestionnaire GPIO pour Raspberry Pi"""
+    """Gestionnaire GPIO pour Raspberry Pi
+    
+    Utilisable comme gestionnaire de contexte asynchrone : cleanup() est
+    appelé à la sortie du bloc ``async with``, même en cas d'exception.
+    
+    Les contrôleurs sont construits en parallèle : setup_pin() est sérialisé
+    par un verrou et les lectures/écritures peuvent venir de plusieurs
+    threads. setup_gpio() et cleanup() restent réservés au thread principal.
+    """
     
     def __init__(self):
         self.pins: Dict[int, Any] = {}
         self.pwm_channels: Dict[int, Any] = {}
         self.initialized = False
+        self.port_snapshot = PortSnapshot()
+        self._gpiomem: Optional[mmap.mmap] = None
+        self._setup_lock = threading.Lock()
         self.setup_gpio()
+        self._open_gpiomem()
+    
+    async def __aenter__(self) -> 'GPIOManager':
+        return self
+    
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType]
+    ) -> None:
+        self.cleanup()
     
     def setup_gpio(self) -> bool:
         """Initialise le système GPIO"""
@@ -45,8 +96,43 @@ class GPIOManager:
             logging.error(f"Erreur lors de l'initialisation GPIO: {e}")
             return False
     
+    def _open_gpiomem(self) -> None:
+        """Projette les registres GPIO en mémoire pour la lecture groupée"""
+        try:
+            fd = os.open(GPIOMEM_PATH, os.O_RDONLY | os.O_SYNC)
+            try:
+                self._gpiomem = mmap.mmap(fd, GPIOMEM_SIZE, mmap.MAP_SHARED, mmap.PROT_READ)
+            finally:
+                os.close(fd)
+        except (OSError, ValueError) as e:
+            # Pas de /dev/gpiomem (hors Raspberry Pi) : lecture pin par pin
+            self._gpiomem = None
+            logging.debug(f"Lecture groupée GPIO indisponible: {e}")
+    
+    def read_all(self) -> Optional[int]:
+        """Lit les niveaux des GPIO 0-31 en une seule lecture du registre GPLEV0"""
+        if self._gpiomem is None:
+            return None
+        
+        try:
+            port: int = struct.unpack_from("<I", self._gpiomem, GPLEV0_OFFSET)[0]
+            return port
+        except (ValueError, struct.error) as e:
+            logging.error(f"Erreur lors de la lecture groupée GPIO: {e}")
+            return None
+    
+    def refresh_port_snapshot(self) -> PortSnapshot:
+        """Rafraîchit l'instantané partagé des niveaux GPIO"""
+        self.port_snapshot.update(self.read_all())
+        return self.port_snapshot
+    
     def setup_pin(self, pin_config: PinConfig) -> bool:
-        """Configure un pin GPIO"""
+        """Configure un pin GPIO (appelable depuis plusieurs threads)"""
+        with self._setup_lock:
+            return self._setup_pin(pin_config)
+    
+    def _setup_pin(self, pin_config: PinConfig) -> bool:
+        """Configure un pin GPIO, verrou de configuration déjà acquis"""
         try:
             pin = pin_config.pin
             mode = pin_config.mode
@@ -101,12 +187,35 @@ class GPIOManager:
         
         try:
             GPIO.output(pin, GPIO.HIGH if state else GPIO.LOW)
+            # L'instantané ne reflète plus l'état du port
+            self.port_snapshot.invalidate()
             logging.debug(f"Pin {pin} mis à {state}")
             return True
         except Exception as e:
             logging.error(f"Erreur lors de l'écriture du pin {pin}: {e}")
             return False
     
+    def add_edge_callback(self, pin: int, callback: Callable[[int], None], bouncetime: int = 200) -> bool:
+        """
+        Appelle callback à chaque front (montant ou descendant) d'un pin d'entrée
+        
+        :param pin: Pin GPIO configuré en entrée
+        :param callback: Fonction appelée avec le numéro du pin, depuis le thread RPi.GPIO
+        :param bouncetime: Délai anti-rebond en millisecondes
+        :return: True si la détection est active, False sinon
+        """
+        if not self.initialized or pin not in self.pins:
+            logging.error(f"Pin {pin} non configuré")
+            return False
+        
+        try:
+            GPIO.add_event_detect(pin, GPIO.BOTH, callback=callback, bouncetime=bouncetime)
+            logging.debug(f"Détection de fronts activée sur le pin {pin}")
+            return True
+        except Exception as e:
+            logging.error(f"Erreur lors de l'activation de la détection de fronts du pin {pin}: {e}")
+            return False
+    
     def set_pin_state(self, pin: int, state: bool) -> bool:
         """Alias pour write_digital - compatibilité avec les contrôleurs existants"""
         return self.write_digital(pin, state)
@@ -190,6 +299,10 @@ class GPIOManager:
             for pwm in self.pwm_channels.values():
                 pwm.stop()
             GPIO.cleanup()
+            if self._gpiomem is not None:
+                self._gpiomem.close()
+                self._gpiomem = None
+            self.port_snapshot.invalidate()
             logging.info("GPIO nettoyé")
         except Exception as e:
             logging.error(f"Erreur lors du nettoyage GPIO: {e}")
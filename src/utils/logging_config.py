@@ -9,7 +9,7 @@ import os
 import sys
 import json
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable
 from pathlib import Path
 
 
@@ -364,10 +364,23 @@ def log_sensor_reading(sensor_type: str, value: float, unit: str):
     })
 
 
-def log_controller_action(controller: str, action: str, success: bool, context: Optional[Dict[str, Any]] = None):
-    """Log une action de contrôleur"""
+def log_controller_action(
+    controller: str,
+    action: str,
+    success: bool,
+    context: Optional[Dict[str, Any]] = None,
+    context_factory: Optional[Callable[[], Dict[str, Any]]] = None
+):
+    """Log une action de contrôleur
+    
+    context_factory n'est appelé que si le message est effectivement émis :
+    les appelants y placent les contextes coûteux (str(e), statuts...).
+    """
     logger = get_logger()
     level = logging.INFO if success else logging.ERROR
+    if not logger.logger.isEnabledFor(level):
+        return
+    
     emoji = "✅" if success else "❌"
     
     log_context = {
@@ -378,8 +391,10 @@ def log_controller_action(controller: str, action: str, success: bool, context:
     }
     if context:
         log_context.update(context)
+    if context_factory:
+        log_context.update(context_factory())
     
-    logger.log(level, f"{emoji} Action {controller}: {action}", log_context)
+    logger.log_with_context(level, f"{emoji} Action {controller}: {action}", log_context)
 
 
 def log_api_request(method: str, path: str, status_code: int, duration_ms: float, user_id: Optional[str] = None):
@@ -147,8 +147,18 @@ def select_config() -> str:
     Sélectionne la configuration par défaut pour le système.
     Cette fonction est utilisée par main.py pour obtenir le chemin de configuration.
     
+    La variable d'environnement SELECTED_CONFIG, si elle est définie, impose le
+    fichier de configuration de l'espèce (utile pour les redémarrages systemd).
+    
     :return: Chemin vers le fichier de configuration de l'espèce par défaut
     """
+    selected_config = os.environ.get('SELECTED_CONFIG')
+    if selected_config:
+        if os.path.exists(selected_config):
+            logging.info(f"Configuration imposée par SELECTED_CONFIG: {selected_config}")
+            return selected_config
+        logging.warning(f"SELECTED_CONFIG introuvable ({selected_config}), sélection par défaut")
+    
     try:
         # Essayer de récupérer l'espèce par défaut depuis la configuration
         default_species = get_default_species()
@@ -2,13 +2,43 @@
 """
 Analyse de câblage pour Alimante
 Vérifie la cohérence entre les contrôleurs et la configuration GPIO
+
+Le module est entièrement annoté et peut être compilé avec mypyc :
+    mypyc tests/diagnostics/analyse_cablage.py
 """
 
-import json
+import os
 import sys
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Set, FrozenSet, Tuple, Iterator, Optional
+
+# Ajouter la racine du projet au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.utils.config_manager import load_json_file
+
+# Types du rapport (annotés pour permettre la compilation avec mypyc)
+PinInfo = Dict[str, Any]
+PinMap = Dict[str, PinInfo]
+ControllerMap = Dict[str, Dict[str, Any]]
+
+# Le rapport est accumulé puis écrit par blocs plutôt qu'un print par ligne
+_OUT: List[str] = []
+_FLUSH_EVERY = 64
+
+def emit(line: str = "") -> None:
+    """Ajoute une ligne au rapport, écrit dès que le bloc est plein"""
+    _OUT.append(line)
+    if len(_OUT) >= _FLUSH_EVERY:
+        flush_output()
 
-def load_gpio_config():
+def flush_output() -> None:
+    """Écrit les lignes en attente sur la sortie standard"""
+    if _OUT:
+        sys.stdout.write("\n".join(_OUT) + "\n")
+        sys.stdout.flush()
+        _OUT.clear()
+
+def load_gpio_config() -> Optional[Dict[str, Any]]:
     """Charge la configuration GPIO"""
     try:
         # Essayer plusieurs chemins possibles
@@ -20,21 +50,21 @@ def load_gpio_config():
         
         for path in possible_paths:
             try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                config: Dict[str, Any] = load_json_file(path)
+                return config
             except FileNotFoundError:
                 continue
         
-        print("❌ Fichier gpio_config.json non trouvé")
+        emit("❌ Fichier gpio_config.json non trouvé")
         return None
         
     except Exception as e:
-        print(f"❌ Erreur chargement GPIO config: {e}")
+        emit(f"❌ Erreur chargement GPIO config: {e}")
         return None
 
-def analyze_controllers():
+def analyze_controllers() -> ControllerMap:
     """Analyse les contrôleurs disponibles"""
-    print("🔍 Analyse des contrôleurs...")
+    emit("🔍 Analyse des contrôleurs...")
     
     # Contrôleurs définis dans l'application
     app_controllers = {
@@ -77,103 +107,115 @@ def analyze_controllers():
     
     return app_controllers
 
-def analyze_gpio_pins(gpio_config):
+def index_controller_pins(app_controllers: ControllerMap) -> Tuple[FrozenSet[str], Dict[str, List[str]]]:
+    """Indexe en une passe les pins requis et les contrôleurs qui les utilisent"""
+    pin_to_controllers: Dict[str, List[str]] = {}
+    for controller_name, controller_info in app_controllers.items():
+        for pin_name in controller_info.get('pins_needed', []):
+            pin_to_controllers.setdefault(pin_name, []).append(controller_name)
+    
+    return frozenset(pin_to_controllers), pin_to_controllers
+
+# Sections de gpio_pins décrivant des composants câblés
+PIN_SECTIONS: Tuple[str, ...] = ('sensors', 'actuators', 'interface', 'status')
+
+def _pin_info(config: Dict[str, Any], pin: Optional[int], category: str) -> PinInfo:
+    """Description d'un pin pour le rapport"""
+    return {
+        'pin': pin,
+        'type': config.get('type'),
+        'voltage': config.get('voltage'),
+        'category': category
+    }
+
+def _iter_component_pins(gpio_pins: Dict[str, Any]) -> Iterator[Tuple[str, PinInfo]]:
+    """Génère (nom, description) pour chaque pin des sections de composants"""
+    for section in PIN_SECTIONS:
+        components = gpio_pins.get(section)
+        if not components:
+            continue
+        
+        try:
+            items = components.items()
+        except AttributeError:
+            continue
+        
+        for name, config in items:
+            try:
+                trigger_pin = config.get('trigger_gpio')
+            except AttributeError:
+                # Feuille qui n'est pas un composant (texte, nombre...)
+                continue
+            
+            if trigger_pin is not None:
+                # Capteur ultrasonique : deux pins trigger/echo
+                yield f"{name}_trigger", _pin_info(config, trigger_pin, section)
+                yield f"{name}_echo", _pin_info(config, config.get('echo_gpio'), section)
+            else:
+                # Capteur/actionneur standard
+                pin = config['gpio_pin'] if 'gpio_pin' in config else config.get('pin')
+                yield name, _pin_info(config, pin, section)
+
+def analyze_gpio_pins(gpio_config: Optional[Dict[str, Any]]) -> Optional[PinMap]:
     """Analyse les pins GPIO configurés"""
-    print("🔍 Analyse des pins GPIO...")
+    emit("🔍 Analyse des pins GPIO...")
     
     if not gpio_config or 'gpio_pins' not in gpio_config:
-        print("❌ Configuration GPIO invalide")
+        emit("❌ Configuration GPIO invalide")
         return None
     
     gpio_pins = gpio_config['gpio_pins']
-    all_pins = {}
     
     # Collecter tous les pins depuis les différentes sections
-    sections = ['sensors', 'actuators', 'interface', 'status']
-    
-    for section in sections:
-        if section in gpio_pins:
-            components = gpio_pins[section]
-            if isinstance(components, dict):
-                for name, config in components.items():
-                    if isinstance(config, dict):
-                        # Gérer les capteurs spéciaux comme water_level
-                        if 'trigger_gpio' in config:
-                            # Capteur ultrasonique
-                            all_pins[f"{name}_trigger"] = {
-                                'pin': config.get('trigger_gpio'),
-                                'type': config.get('type'),
-                                'voltage': config.get('voltage'),
-                                'category': section
-                            }
-                            all_pins[f"{name}_echo"] = {
-                                'pin': config.get('echo_gpio'),
-                                'type': config.get('type'),
-                                'voltage': config.get('voltage'),
-                                'category': section
-                            }
-                        else:
-                            # Capteur/actionneur standard
-                            pin_key = 'gpio_pin' if 'gpio_pin' in config else 'pin'
-                            all_pins[name] = {
-                                'pin': config.get(pin_key),
-                                'type': config.get('type'),
-                                'voltage': config.get('voltage'),
-                                'category': section
-                            }
+    all_pins = dict(_iter_component_pins(gpio_pins))
     
     # Gérer led_strip séparément car c'est un objet direct
-    if 'led_strip' in gpio_pins:
-        led_config = gpio_pins['led_strip']
-        if isinstance(led_config, dict):
-            all_pins['led_strip'] = {
-                'pin': led_config.get('gpio_pin'),
-                'type': led_config.get('type'),
-                'voltage': led_config.get('voltage'),
-                'category': 'led_strip'
-            }
+    led_config = gpio_pins.get('led_strip')
+    if led_config is not None:
+        try:
+            all_pins['led_strip'] = _pin_info(led_config, led_config.get('gpio_pin'), 'led_strip')
+        except AttributeError:
+            pass
     
     return all_pins
 
-def check_controller_gpio_mapping(app_controllers, gpio_pins):
+def check_controller_gpio_mapping(
+    app_controllers: ControllerMap,
+    gpio_pins: PinMap,
+    required_pins: FrozenSet[str]
+) -> Tuple[List[str], List[str], List[str]]:
     """Vérifie la correspondance entre contrôleurs et pins GPIO"""
-    print("🔍 Vérification correspondance contrôleurs ↔ GPIO...")
+    emit("🔍 Vérification correspondance contrôleurs ↔ GPIO...")
     
-    issues = []
-    missing_pins = []
-    unused_pins = []
+    issues: List[str] = []
+    missing_pins: List[str] = []
+    unused_pins: List[str] = []
     
     # Vérifier que chaque contrôleur a ses pins nécessaires
     for controller_name, controller_info in app_controllers.items():
-        print(f"\n🎛️ Contrôleur: {controller_name}")
+        emit(f"\n🎛️ Contrôleur: {controller_name}")
         
         for pin_name in controller_info.get('pins_needed', []):
             if pin_name in gpio_pins:
                 pin_info = gpio_pins[pin_name]
-                print(f"   ✅ {pin_name}: GPIO {pin_info['pin']} ({pin_info['type']})")
+                emit(f"   ✅ {pin_name}: GPIO {pin_info['pin']} ({pin_info['type']})")
             else:
-                print(f"   ❌ {pin_name}: MANQUANT")
+                emit(f"   ❌ {pin_name}: MANQUANT")
                 missing_pins.append(f"{controller_name}.{pin_name}")
                 issues.append(f"Pin manquant pour {controller_name}: {pin_name}")
     
-    # Vérifier les pins non utilisés
-    used_pins = set()
-    for controller_info in app_controllers.values():
-        for pin_name in controller_info.get('pins_needed', []):
-            used_pins.add(pin_name)
-    
-    for pin_name, pin_info in gpio_pins.items():
-        if pin_name not in used_pins:
-            unused_pins.append(pin_name)
-            print(f"   ⚠️ {pin_name}: Non utilisé par les contrôleurs")
+    # Vérifier les pins non utilisés (différence d'ensembles, ordre alphabétique)
+    unused_pins.extend(sorted(gpio_pins.keys() - required_pins))
+    for pin_name in unused_pins:
+        emit(f"   ⚠️ {pin_name}: Non utilisé par les contrôleurs")
     
     return issues, missing_pins, unused_pins
 
-def check_voltage_consistency(gpio_pins):
+def check_voltage_consistency(gpio_pins: PinMap) -> List[str]:
     """Vérifie la cohérence des tensions"""
-    print("\n🔍 Vérification cohérence des tensions...")
+    emit("\n🔍 Vérification cohérence des tensions...")
     
-    voltage_issues = []
+    voltage_issues: List[str] = []
     
     # Vérifier les composants 3.3V
     components_3v3 = []
@@ -186,45 +228,45 @@ def check_voltage_consistency(gpio_pins):
         elif voltage == '5V':
             components_5v.append(pin_name)
     
-    print(f"   📊 Composants 3.3V: {len(components_3v3)}")
+    emit(f"   📊 Composants 3.3V: {len(components_3v3)}")
     for comp in components_3v3:
-        print(f"      - {comp}")
+        emit(f"      - {comp}")
     
-    print(f"   📊 Composants 5V: {len(components_5v)}")
+    emit(f"   📊 Composants 5V: {len(components_5v)}")
     for comp in components_5v:
-        print(f"      - {comp}")
+        emit(f"      - {comp}")
     
     return voltage_issues
 
-def check_power_requirements(gpio_config):
+def check_power_requirements(gpio_config: Dict[str, Any]) -> None:
     """Vérifie les besoins en alimentation"""
-    print("\n🔍 Analyse des besoins en alimentation...")
+    emit("\n🔍 Analyse des besoins en alimentation...")
     
     if 'power_supply' not in gpio_config:
-        print("   ⚠️ Section power_supply manquante")
+        emit("   ⚠️ Section power_supply manquante")
         return
     
     power_config = gpio_config['power_supply']
     
-    print("   📊 Configuration alimentation:")
+    emit("   📊 Configuration alimentation:")
     for key, value in power_config.items():
-        print(f"      - {key}: {value}")
+        emit(f"      - {key}: {value}")
     
     # Vérifier les tensions spéciales
     if 'led_strip_voltage' in power_config and power_config['led_strip_voltage'] == '12V':
-        print("   ✅ Bandeau LED 12V configuré")
+        emit("   ✅ Bandeau LED 12V configuré")
     
     if 'sensors_voltage' in power_config and power_config['sensors_voltage'] == '3.3V':
-        print("   ✅ Capteurs 3.3V configurés")
+        emit("   ✅ Capteurs 3.3V configurés")
 
-def generate_wiring_summary(gpio_pins, app_controllers):
+def generate_wiring_summary(gpio_pins: PinMap, pin_to_controllers: Dict[str, List[str]]) -> None:
     """Génère un résumé du câblage"""
-    print("\n" + "=" * 60)
-    print("📋 RÉSUMÉ DU CÂBLAGE")
-    print("=" * 60)
+    emit("\n" + "=" * 60)
+    emit("📋 RÉSUMÉ DU CÂBLAGE")
+    emit("=" * 60)
     
     # Par catégorie
-    categories = {
+    categories: Dict[str, List[PinInfo]] = {
         'sensors': [],
         'actuators': [],
         'inputs': [],
@@ -243,15 +285,15 @@ def generate_wiring_summary(gpio_pins, app_controllers):
     
     for category, components in categories.items():
         if components:
-            print(f"\n🔧 {category.upper()}:")
+            emit(f"\n🔧 {category.upper()}:")
             for comp in components:
-                status = "✅" if any(comp['name'] in c.get('pins_needed', []) for c in app_controllers.values()) else "⚠️"
-                print(f"   {status} {comp['name']}: GPIO {comp['pin']} ({comp['type']}) - {comp['voltage']}")
+                status = "✅" if pin_to_controllers.get(comp['name']) else "⚠️"
+                emit(f"   {status} {comp['name']}: GPIO {comp['pin']} ({comp['type']}) - {comp['voltage']}")
 
-def main():
+def main() -> bool:
     """Programme principal"""
-    print("🧪 Analyse de Câblage Alimante")
-    print("=" * 50)
+    emit("🧪 Analyse de Câblage Alimante")
+    emit("=" * 50)
     
     # Charger la configuration
     gpio_config = load_gpio_config()
@@ -260,6 +302,7 @@ def main():
     
     # Analyser les contrôleurs
     app_controllers = analyze_controllers()
+    required_pins, pin_to_controllers = index_controller_pins(app_controllers)
     
     # Analyser les pins GPIO
     gpio_pins = analyze_gpio_pins(gpio_config)
@@ -267,46 +310,49 @@ def main():
         return False
     
     # Vérifications
-    issues, missing_pins, unused_pins = check_controller_gpio_mapping(app_controllers, gpio_pins)
+    issues, missing_pins, unused_pins = check_controller_gpio_mapping(app_controllers, gpio_pins, required_pins)
     check_voltage_consistency(gpio_pins)
     check_power_requirements(gpio_config)
     
     # Résumé
-    generate_wiring_summary(gpio_pins, app_controllers)
+    generate_wiring_summary(gpio_pins, pin_to_controllers)
     
     # Rapport final
-    print("\n" + "=" * 60)
-    print("📊 RAPPORT FINAL")
-    print("=" * 60)
+    emit("\n" + "=" * 60)
+    emit("📊 RAPPORT FINAL")
+    emit("=" * 60)
     
     if issues:
-        print(f"❌ Problèmes détectés: {len(issues)}")
+        emit(f"❌ Problèmes détectés: {len(issues)}")
         for issue in issues:
-            print(f"   - {issue}")
+            emit(f"   - {issue}")
     else:
-        print("✅ Aucun problème de câblage détecté")
+        emit("✅ Aucun problème de câblage détecté")
     
     if missing_pins:
-        print(f"⚠️ Pins manquants: {len(missing_pins)}")
+        emit(f"⚠️ Pins manquants: {len(missing_pins)}")
         for pin in missing_pins:
-            print(f"   - {pin}")
+            emit(f"   - {pin}")
     
     if unused_pins:
-        print(f"ℹ️ Pins non utilisés: {len(unused_pins)}")
+        emit(f"ℹ️ Pins non utilisés: {len(unused_pins)}")
         for pin in unused_pins:
-            print(f"   - {pin}")
+            emit(f"   - {pin}")
     
     # Recommandations
-    print("\n💡 Recommandations:")
+    emit("\n💡 Recommandations:")
     if missing_pins:
-        print("   - Ajouter les pins manquants dans la configuration")
+        emit("   - Ajouter les pins manquants dans la configuration")
     if unused_pins:
-        print("   - Vérifier si les pins non utilisés sont nécessaires")
+        emit("   - Vérifier si les pins non utilisés sont nécessaires")
     if not issues and not missing_pins:
-        print("   - Le câblage semble correct !")
+        emit("   - Le câblage semble correct !")
     
     return len(issues) == 0
 
 if __name__ == "__main__":
-    success = main()
+    try:
+        success = main()
+    finally:
+        flush_output()
     sys.exit(0 if success else 1)
@@ -206,7 +206,8 @@ async def test_integration():
     
     try:
         from src.utils.config_manager import SystemConfig
-        from main import initialize_system, run_system_loop
+        from src.utils.gpio_manager import GPIOManager
+        from main import initialize_system
         
         # Charger la configuration
         config = SystemConfig.from_json(
@@ -218,18 +219,20 @@ async def test_integration():
         print("✅ Configuration chargée")
         
         # Initialiser le système
-        controllers = initialize_system(config)
+        gpio_manager = GPIOManager()
+        controllers = initialize_system(gpio_manager, config)
         
-        if not controllers:
+        active_controllers = dict(controllers.active())
+        if not active_controllers:
             print("❌ Aucun contrôleur initialisé")
             return False
         
-        print(f"✅ {len(controllers)} contrôleurs initialisés")
+        print(f"✅ {len(active_controllers)} contrôleurs initialisés")
         
         # Vérifier la présence des contrôleurs de ventilation
         required_controllers = ['air_quality', 'fan']
         for controller_name in required_controllers:
-            if controller_name in controllers:
+            if controller_name in active_controllers:
                 print(f"✅ Contrôleur {controller_name} présent")
             else:
                 print(f"❌ Contrôleur {controller_name} manquant")
@@ -243,9 +246,9 @@ async def test_integration():
             print(f"   Cycle {i+1}/3...")
             
             # Contrôle de la qualité de l'air et ventilation
-            if 'air_quality' in controllers and 'fan' in controllers:
+            if controllers.air_quality is not None and controllers.fan is not None:
                 try:
-                    success = controllers['air_quality'].control_ventilation(controllers['fan'])
+                    success = controllers.air_quality.control_ventilation(controllers.fan)
                     print(f"      Contrôle ventilation: {'✅ Succès' if success else '❌ Échec'}")
                 except Exception as e:
                     print(f"      ❌ Erreur: {e}")
@@ -254,13 +257,14 @@ async def test_integration():
         
         # Nettoyage
         print("\n🧹 Nettoyage...")
-        for controller_name, controller in controllers.items():
+        for controller_name, controller in active_controllers.items():
             try:
                 if hasattr(controller, 'cleanup'):
                     controller.cleanup()
                     print(f"   ✅ {controller_name} nettoyé")
             except Exception as e:
                 print(f"   ⚠️ Erreur nettoyage {controller_name}: {e}")
+        gpio_manager.cleanup()
         
         print("✅ Test d'intégration terminé")
         return True
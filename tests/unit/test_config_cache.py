@@ -0,0 +1,52 @@
+import json
+import os
+import pytest
+from src.utils.config_manager import load_json_file
+from src.utils.select_config import select_config
+
+def write_json(path, data):
+    path.write_text(json.dumps(data))
+
+def touch_later(path):
+    # Garantit une date de modification différente, quelle que soit la résolution du système de fichiers
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+def test_load_json_file_cache_hit(tmp_path):
+    path = tmp_path / "data.json"
+    write_json(path, {"value": 1})
+
+    first = load_json_file(path)
+    assert first == {"value": 1}
+    assert load_json_file(str(path)) is first
+
+def test_load_json_file_reloads_modified_file(tmp_path):
+    path = tmp_path / "data.json"
+    write_json(path, {"value": 1})
+    first = load_json_file(path)
+
+    write_json(path, {"value": 2})
+    touch_later(path)
+
+    second = load_json_file(path)
+    assert second == {"value": 2}
+    assert second is not first
+
+def test_load_json_file_missing(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_json_file(tmp_path / "missing.json")
+
+def test_select_config_env_override(monkeypatch, tmp_path):
+    specific = str(tmp_path / "species.json")
+    write_json(tmp_path / "species.json", {"species_info": {"species_name": "Mantis religiosa"}})
+    monkeypatch.setenv("SELECTED_CONFIG", specific)
+
+    assert select_config() == specific
+
+def test_select_config_env_missing_falls_back(monkeypatch, tmp_path):
+    monkeypatch.delenv("SELECTED_CONFIG", raising=False)
+    default = select_config()
+
+    monkeypatch.setenv("SELECTED_CONFIG", str(tmp_path / "missing.json"))
+
+    assert select_config() == default
@@ -0,0 +1,116 @@
+import asyncio
+import pytest
+from unittest.mock import Mock
+import main
+from main import (
+    Controllers,
+    _next_interval,
+    _wake_delay,
+    _ventilation_control,
+    _edge_waker,
+    MIN_CONTROL_INTERVAL,
+    MAX_INTERVAL_FACTOR
+)
+
+def test_next_interval_shrinks_after_action():
+    assert _next_interval(120, True, 30) == 60
+    assert _next_interval(45, True, 30) == 30
+
+def test_next_interval_floored_at_base():
+    assert _next_interval(30, True, 30) == 30
+    assert _next_interval(10, True, 10) == 10
+
+@pytest.mark.parametrize("success", [False, None])
+def test_next_interval_grows_when_idle(success):
+    assert _next_interval(30, success, 30) == 45
+    assert _next_interval(100, success, 30) == 30 * MAX_INTERVAL_FACTOR
+
+def test_wake_delay_without_deadline():
+    assert _wake_delay(45, None) == 45
+
+def test_wake_delay_capped_by_future_deadline():
+    assert _wake_delay(3600, 600) == 600
+    assert _wake_delay(3600, 0.5) == MIN_CONTROL_INTERVAL
+
+def test_wake_delay_ignores_reached_deadline():
+    # Repas dû mais non servi : on suit l'intervalle adaptatif
+    assert _wake_delay(5400, 0.0) == 5400
+
+def make_fan(changes_state):
+    fan = Mock()
+    fan.fans_active = False
+    fan.current_speed = 0
+
+    def control_ventilation(**_kwargs):
+        if changes_state:
+            fan.fans_active = True
+        return True
+
+    fan.control_ventilation.side_effect = control_ventilation
+    fan.get_status.return_value = {}
+    return fan
+
+def make_temperature():
+    temperature = Mock()
+    temperature.get_status.return_value = {'current_temperature': 30.0}
+    return temperature
+
+def test_ventilation_without_change_is_idle():
+    fan = make_fan(False)
+    control = _ventilation_control(Controllers(temperature=make_temperature(), fan=fan), fan)
+
+    assert control() is None
+
+def test_ventilation_with_change_is_action():
+    fan = make_fan(True)
+    control = _ventilation_control(Controllers(temperature=make_temperature(), fan=fan), fan)
+
+    assert control() is True
+
+def test_ventilation_failure():
+    fan = make_fan(False)
+    fan.control_ventilation.side_effect = None
+    fan.control_ventilation.return_value = False
+    control = _ventilation_control(Controllers(temperature=make_temperature(), fan=fan), fan)
+
+    assert control() is False
+
+def test_edge_waker_rate_limited(monkeypatch):
+    loop = Mock()
+    event = Mock()
+    clock = iter([100.0, 100.5, 131.0])
+    monkeypatch.setattr('main.time.monotonic', lambda: next(clock))
+    on_edge = _edge_waker(loop, event, 30)
+
+    on_edge(17)
+    on_edge(17)  # rebond du seuil, ignoré
+    on_edge(17)
+
+    assert loop.call_soon_threadsafe.call_count == 2
+    loop.call_soon_threadsafe.assert_called_with(event.set)
+
+def test_pulse_actuator_not_relaunched_faster_than_base(monkeypatch):
+    # Brumisateur : chaque passage déclenche une impulsion et renvoie True
+    monkeypatch.setattr(main, 'MIN_CONTROL_INTERVAL', 0.001)
+    calls = []
+
+    def control():
+        calls.append(True)
+        return True
+
+    async def run():
+        event = asyncio.Event()
+        event.set()
+        task = asyncio.ensure_future(main._controller_task(
+            'humidity', 'control', control, event, lambda: None,
+            base_interval=0.05
+        ))
+        await asyncio.sleep(0.52)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+
+    # Un contrôle immédiat puis un toutes les 50 ms au plus
+    assert 5 <= len(calls) <= 11
@@ -0,0 +1,73 @@
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+from src.controllers.feeding_controller import FeedingController
+
+def make_controller(hardware_config=None):
+    mock_gpio = Mock()
+    mock_gpio.initialized = True
+    config = {
+        'feeding': {
+            'interval_days': 3,
+            'feed_count': 2,
+            'servo_open_angle': 90,
+            'servo_close_angle': 0
+        },
+        'gpio_config': {
+            'pin_assignments': {'FEEDING_SERVO_PIN': 12},
+            'hardware_config': hardware_config or {}
+        }
+    }
+    return FeedingController(mock_gpio, config), mock_gpio
+
+def test_open_trap():
+    controller, mock_gpio = make_controller()
+
+    assert controller.open_trap() is True
+
+    # 90° sur une plage 500-2500 µs
+    mock_gpio.set_servo_position.assert_called_once_with(12, 1500.0)
+
+def test_close_trap():
+    controller, mock_gpio = make_controller()
+
+    assert controller.close_trap() is True
+
+    mock_gpio.set_servo_position.assert_called_once_with(12, 500.0)
+
+def test_trap_uses_hardware_config():
+    controller, mock_gpio = make_controller({
+        'servo': {'feeding_trap': {'open_angle': 180, 'min_pulse': 1000, 'max_pulse': 2000}}
+    })
+
+    assert controller.open_trap() is True
+
+    mock_gpio.set_servo_position.assert_called_once_with(12, 2000.0)
+
+def test_seconds_until_next_feeding_due_without_history():
+    controller, _ = make_controller()
+
+    assert controller.seconds_until_next_feeding() == 0.0
+
+def test_seconds_until_next_feeding_after_meal():
+    controller, _ = make_controller()
+    controller.last_feeding_time = datetime.now() - timedelta(days=1)
+    controller.feeding_count = 1
+
+    # Intervalle de 3 jours, dernier repas il y a 1 jour
+    delay = controller.seconds_until_next_feeding()
+    assert delay == pytest.approx(timedelta(days=2).total_seconds(), abs=5)
+
+def test_seconds_until_next_feeding_overdue():
+    controller, _ = make_controller()
+    controller.last_feeding_time = datetime.now() - timedelta(days=4)
+    controller.feeding_count = 1
+
+    assert controller.seconds_until_next_feeding() == 0.0
+
+def test_seconds_until_next_feeding_cycle_complete():
+    controller, _ = make_controller()
+    controller.last_feeding_time = datetime.now()
+    controller.feeding_count = 2
+
+    assert controller.seconds_until_next_feeding() is None
@@ -4,6 +4,7 @@ Tests unitaires pour le système de logging Alimante
 """
 
 import unittest
+import logging
 import tempfile
 import shutil
 import os
@@ -162,6 +163,26 @@ class TestLoggingFunctions(unittest.TestCase):
         log_controller_action("fan", "stop", False, {"error": "timeout"})
         self.assertTrue(True)  # Pas d'erreur = succès
     
+    def test_controller_logging_lazy_context(self):
+        """Test du contexte paresseux : construit seulement si le log est émis"""
+        calls = []
+        
+        def context_factory():
+            calls.append(1)
+            return {"error": "timeout"}
+        
+        log_controller_action("fan", "stop", False, context_factory=context_factory)
+        self.assertEqual(len(calls), 1)
+        
+        logger = get_logger()
+        previous_level = logger.logger.level
+        logger.logger.setLevel(logging.CRITICAL)
+        try:
+            log_controller_action("fan", "stop", False, context_factory=context_factory)
+        finally:
+            logger.logger.setLevel(previous_level)
+        self.assertEqual(len(calls), 1)
+    
     def test_api_logging(self):
         """Test du logging d'API"""
         log_api_request("GET", "/api/sensors", 200, 45.2, "user123")
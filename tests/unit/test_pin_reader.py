@@ -0,0 +1,48 @@
+import pytest
+from unittest.mock import Mock
+from src.controllers.base_controller import BaseController
+from src.utils.gpio_manager import PortSnapshot
+
+class DummyController(BaseController):
+    def check_status(self):
+        return True
+
+    def get_status(self):
+        return {}
+
+    def control(self):
+        return False
+
+def make_controller(configured_pins):
+    mock_gpio = Mock()
+    mock_gpio.pins = {pin: None for pin in configured_pins}
+    mock_gpio.get_pin_state.return_value = None
+    snapshot = PortSnapshot()
+    return DummyController(mock_gpio, {'port_snapshot': snapshot}), mock_gpio, snapshot
+
+def test_pin_reader_uses_snapshot():
+    controller, mock_gpio, snapshot = make_controller([18])
+    read = controller.pin_reader(18)
+
+    snapshot.update(1 << 18)
+    assert read() is True
+    snapshot.update(0)
+    assert read() is False
+    mock_gpio.get_pin_state.assert_not_called()
+
+def test_pin_reader_falls_back_when_snapshot_stale():
+    controller, mock_gpio, snapshot = make_controller([18])
+    mock_gpio.get_pin_state.return_value = True
+    read = controller.pin_reader(18)
+
+    assert read() is True
+    mock_gpio.get_pin_state.assert_called_once_with(18)
+
+def test_pin_reader_unconfigured_pin():
+    controller, mock_gpio, snapshot = make_controller([])
+    read = controller.pin_reader(24)
+
+    # Le niveau brut d'un pin non configuré n'est pas exploitable
+    snapshot.update(1 << 24)
+    assert read() is None
+    mock_gpio.get_pin_state.assert_called_once_with(24)